@@ -7,7 +7,7 @@ Gère les paramètres utilisateur et les associations application/dossier
 import json
 import os
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Callable
 import logging
 
 class SettingsManager:
@@ -41,7 +41,10 @@ class SettingsManager:
                 "include_cursor": False,
                 "auto_filename": True,
                 "filename_pattern": "Screenshot_%Y%m%d_%H%M%S",
-                "delay_seconds": 0
+                "delay_seconds": 0,
+                "png_compress_level": 1,
+                "background_recompress": False,
+                "use_mmap_output": False
             },
             "ui_settings": {
                 "theme": "dark",
@@ -62,6 +65,9 @@ class SettingsManager:
             }
         }
         
+        # Callbacks appelés après chaque sauvegarde de la configuration
+        self._change_callbacks: List[Callable[[], None]] = []
+        
         self.config = self.load_config()
         self.ensure_folders_exist()
     
@@ -86,6 +92,9 @@ class SettingsManager:
     
     def save_config(self) -> bool:
         """Sauvegarde la configuration dans le fichier"""
+        # La configuration en mémoire a changé, même si l'écriture échoue
+        self._notify_change()
+        
         try:
             # Créer une sauvegarde si demandé
             if self.config.get("advanced", {}).get("backup_settings", True):
@@ -151,6 +160,18 @@ class SettingsManager:
         except Exception as e:
             self.logger.error(f"Erreur création sauvegarde: {e}")
     
+    def add_change_callback(self, callback: Callable[[], None]):
+        """Ajoute un callback appelé quand la configuration est modifiée"""
+        self._change_callbacks.append(callback)
+    
+    def _notify_change(self):
+        """Notifie les callbacks d'un changement de configuration"""
+        for callback in self._change_callbacks:
+            try:
+                callback()
+            except Exception as e:
+                self.logger.error(f"Erreur callback changement configuration: {e}")
+    
     # Méthodes d'accès aux paramètres
     def get_hotkey(self, action: str) -> str:
         """Récupère un raccourci clavier"""
@@ -10,9 +10,20 @@ import logging
 from typing import Dict, Callable, Optional, List, Tuple
 import time
 import weakref
+from functools import lru_cache
 
 from config.settings import SettingsManager
 
+
+@lru_cache(maxsize=64)
+def _check_hotkey(normalized_hotkey: str) -> str:
+    """Valide un hotkey normalisé (résultat mis en cache, lève si invalide)"""
+    # Seule la validation est mise en cache : keyboard.add_hotkey reçoit la
+    # chaîne, une forme parsée d'une seule étape y serait lue comme une touche
+    keyboard.parse_hotkey(normalized_hotkey)
+    return normalized_hotkey
+
+
 class HotkeyManager:
     """Gestionnaire de raccourcis clavier globaux"""
 
@@ -23,6 +34,9 @@ class HotkeyManager:
         # Dictionnaire des callbacks enregistrés par action
         self.action_callbacks: Dict[str, List[Callable]] = {}
 
+        # Cache des weak references par callback (évite de les recréer)
+        self._weakref_cache: Dict[tuple, weakref.ref] = {}
+
         # Dictionnaire des hotkeys actifs (keyboard hooks)
         self.active_hotkeys: Dict[str, str] = {}  # action -> hotkey string
         self.keyboard_hooks: List = []  # Liste des hooks keyboard
@@ -88,10 +102,7 @@ class HotkeyManager:
                 self.action_callbacks[action] = []
 
             # Utilise une weak reference pour éviter les fuites mémoire
-            if hasattr(callback, '__self__'):
-                weak_callback = weakref.WeakMethod(callback)
-            else:
-                weak_callback = weakref.ref(callback)
+            weak_callback = self._get_weak_callback(callback)
 
             self.action_callbacks[action].append(weak_callback)
             self.logger.info(f"Callback ajouté pour l'action: {action}")
@@ -101,6 +112,37 @@ class HotkeyManager:
             self.logger.error(f"Erreur ajout callback {action}: {e}")
             return False
 
+    def _get_weak_callback(self, callback: Callable) -> weakref.ref:
+        """Retourne la weak reference d'un callback, réutilisée si déjà créée"""
+        # Une méthode liée est recréée à chaque accès : on l'identifie par
+        # son objet et sa fonction plutôt que par son id
+        if hasattr(callback, '__self__'):
+            key = (id(callback.__self__), id(callback.__func__))
+        else:
+            key = (id(callback),)
+
+        weak_callback = self._weakref_cache.get(key)
+        # Vérifie que la référence en cache pointe toujours sur ce callback
+        # (un id peut être réutilisé après la destruction de l'objet)
+        if weak_callback is not None and weak_callback() == callback:
+            return weak_callback
+
+        # Retire l'entrée du cache à la destruction du callback (sinon les
+        # références mortes resteraient indexées par des id recyclés)
+        cache = self._weakref_cache
+
+        def evict(ref):
+            if cache.get(key) is ref:
+                cache.pop(key, None)
+
+        if hasattr(callback, '__self__'):
+            weak_callback = weakref.WeakMethod(callback, evict)
+        else:
+            weak_callback = weakref.ref(callback, evict)
+
+        cache[key] = weak_callback
+        return weak_callback
+
     def remove_action_callback(self, action: str, callback: Callable) -> bool:
         """Supprime un callback d'une action"""
         try:
@@ -124,16 +166,26 @@ class HotkeyManager:
                 'quick_capture'
             ]
 
-            success_count = 0
-
+            # Rassemble d'abord les hotkeys à enregistrer (validation unique par hotkey)
+            pending = []
             for action in default_actions:
                 hotkey = self.settings.get_hotkey(action)
                 if hotkey and hotkey.strip():
-                    if self._register_single_hotkey(action, hotkey):
-                        success_count += 1
-                        self.logger.info(f"Hotkey enregistré: {action} -> {hotkey}")
-                    else:
+                    normalized = self._get_normalized_hotkey(hotkey)
+                    if normalized is None:
+                        self.logger.error(f"Format hotkey invalide: {hotkey}")
                         self.logger.warning(f"Échec enregistrement hotkey: {action} -> {hotkey}")
+                        continue
+                    pending.append((action, hotkey, normalized))
+
+            success_count = 0
+
+            for action, hotkey, normalized in pending:
+                if self._add_normalized_hotkey(action, hotkey, normalized):
+                    success_count += 1
+                    self.logger.info(f"Hotkey enregistré: {action} -> {hotkey}")
+                else:
+                    self.logger.warning(f"Échec enregistrement hotkey: {action} -> {hotkey}")
 
             return success_count > 0
 
@@ -144,8 +196,9 @@ class HotkeyManager:
     def _register_single_hotkey(self, action: str, hotkey: str) -> bool:
         """Enregistre un seul hotkey"""
         try:
-            # Parse et valide le hotkey
-            if not self._validate_hotkey(hotkey):
+            # Normalise et valide le hotkey
+            normalized = self._get_normalized_hotkey(hotkey)
+            if normalized is None:
                 self.logger.error(f"Format hotkey invalide: {hotkey}")
                 return False
 
@@ -153,36 +206,46 @@ class HotkeyManager:
             if action in self.active_hotkeys:
                 self._unregister_single_hotkey(action)
 
-            # Crée le callback pour cette action
-            callback = self._create_action_callback(action)
-
-            # Enregistre le hotkey avec keyboard
-            try:
-                # Normalise le hotkey pour keyboard
-                normalized_hotkey = self._normalize_hotkey(hotkey)
+            return self._add_normalized_hotkey(action, hotkey, normalized)
 
-                # Ajoute le hook
-                hook = keyboard.add_hotkey(
-                    normalized_hotkey,
-                    callback,
-                    suppress=True,
-                    trigger_on_release=False
-                )
+        except Exception as e:
+            self.logger.error(f"Erreur enregistrement hotkey {action}: {e}")
+            return False
 
-                # Enregistre le hook pour pouvoir le supprimer plus tard
-                self.keyboard_hooks.append(hook)
-                self.active_hotkeys[action] = hotkey
+    def _add_normalized_hotkey(self, action: str, hotkey: str, normalized: str) -> bool:
+        """Ajoute le hook keyboard pour un hotkey déjà normalisé et validé"""
+        # Crée le callback pour cette action
+        callback = self._create_action_callback(action)
 
-                return True
+        try:
+            # Ajoute le hook
+            hook = keyboard.add_hotkey(
+                normalized,
+                callback,
+                suppress=True,
+                trigger_on_release=False
+            )
+
+            # Enregistre le hook pour pouvoir le supprimer plus tard
+            self.keyboard_hooks.append(hook)
+            self.active_hotkeys[action] = hotkey
 
-            except Exception as e:
-                self.logger.error(f"Erreur enregistrement keyboard pour {hotkey}: {e}")
-                return False
+            return True
 
         except Exception as e:
-            self.logger.error(f"Erreur enregistrement hotkey {action}: {e}")
+            self.logger.error(f"Erreur enregistrement keyboard pour {hotkey}: {e}")
             return False
 
+    def _get_normalized_hotkey(self, hotkey: str) -> Optional[str]:
+        """Retourne la forme normalisée d'un hotkey, ou None s'il est invalide"""
+        if not hotkey or not hotkey.strip():
+            return None
+
+        try:
+            return _check_hotkey(self._normalize_hotkey(hotkey))
+        except Exception:
+            return None
+
     def _unregister_single_hotkey(self, action: str) -> bool:
         """Supprime un hotkey spécifique"""
         try:
@@ -194,7 +257,7 @@ class HotkeyManager:
                 # Supprime l'action de la liste
                 del self.active_hotkeys[action]
 
-                # Ré-enregistre tous les autres hotkeys
+                # Ré-enregistre tous les autres hotkeys (validation en cache)
                 temp_hotkeys = self.active_hotkeys.copy()
                 self.active_hotkeys.clear()
 
@@ -288,8 +351,10 @@ class HotkeyManager:
             if not hotkey or not hotkey.strip():
                 return False
 
-            # Teste avec keyboard
-            normalized = self._normalize_hotkey(hotkey)
+            # Teste avec keyboard (validation mise en cache)
+            normalized = self._get_normalized_hotkey(hotkey)
+            if normalized is None:
+                return False
 
             # Test d'enregistrement temporaire
             try:
@@ -23,7 +23,8 @@ class MemoryManager:
         self.monitor_thread: Optional[threading.Thread] = None
 
         # Collections pour tracking des objets
-        self._tracked_objects: Dict[str, List[weakref.ref]] = {}
+        # Par catégorie : id(objet) -> weak reference, retirée par son callback
+        self._tracked_objects: Dict[str, Dict[int, weakref.ref]] = {}
         self._cleanup_callbacks: List[callable] = []
         self._lock = threading.RLock()
 
@@ -88,20 +89,19 @@ class MemoryManager:
     def track_object(self, obj: Any, category: str = "default") -> weakref.ref:
         """Ajoute un objet au tracking avec weak reference"""
         with self._lock:
-            if category not in self._tracked_objects:
-                self._tracked_objects[category] = []
+            refs = self._tracked_objects.setdefault(category, {})
+            key = id(obj)
 
-            # Callback de nettoyage automatique quand l'objet est détruit
+            # Callback de nettoyage automatique quand l'objet est détruit (O(1) :
+            # plus de parcours des références mortes)
             def cleanup_callback(ref):
                 with self._lock:
-                    if category in self._tracked_objects:
-                        try:
-                            self._tracked_objects[category].remove(ref)
-                        except ValueError:
-                            pass
+                    category_refs = self._tracked_objects.get(category)
+                    if category_refs is not None and category_refs.get(key) is ref:
+                        del category_refs[key]
 
             weak_ref = weakref.ref(obj, cleanup_callback)
-            self._tracked_objects[category].append(weak_ref)
+            refs[key] = weak_ref
 
             return weak_ref
 
@@ -122,9 +122,6 @@ class MemoryManager:
                 except Exception as e:
                     self.logger.error(f"Erreur callback nettoyage: {e}")
 
-            # Nettoie les références mortes
-            self._cleanup_dead_references()
-
             # Force le garbage collection
             collected = gc.collect()
 
@@ -146,15 +143,6 @@ class MemoryManager:
 
         return collected
 
-    def _cleanup_dead_references(self):
-        """Nettoie les weak references mortes"""
-        for category in list(self._tracked_objects.keys()):
-            alive_refs = []
-            for ref in self._tracked_objects[category]:
-                if ref() is not None:
-                    alive_refs.append(ref)
-            self._tracked_objects[category] = alive_refs
-
     def _force_memory_release(self):
         """Force la libération mémoire avec techniques avancées"""
         try:
@@ -172,7 +160,7 @@ class MemoryManager:
         """Retourne le nombre d'objets trackés par catégorie"""
         with self._lock:
             return {
-                category: len([ref for ref in refs if ref() is not None])
+                category: len(refs)
                 for category, refs in self._tracked_objects.items()
             }
 
@@ -7,23 +7,44 @@ CORRECTION : Capture zone utilise l'image figée, pas une nouvelle capture
 NOUVEAU : Dialogue de choix de dossier pour applications non configurées
 """
 
-import pyautogui
 import time
 import os
+import io
+import re
+import mmap
+import struct
 import tkinter as tk
+import tkinter.font as tkfont
 from tkinter import messagebox, filedialog
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, Tuple, Callable, Any, Dict
-from PIL import Image, ImageGrab, ImageTk, ImageEnhance
+from typing import Optional, Tuple, Callable, Any, Dict, List
+from PIL import Image, ImageGrab, ImageTk
 import logging
 import threading
 import tempfile
-import weakref
 import platform
+from collections import OrderedDict
+from contextlib import contextmanager
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
+
+# Import conditionnel pour Windows (désactivé par défaut sur les autres systèmes,
+# pour que les captures y passent par MSS / PyAutoGUI)
+WINDOWS_AVAILABLE = False
 
-# Import conditionnel pour Windows
 if platform.system() == "Windows":
+    # Coordonnées physiques pour tout le processus (métriques, Tk, GDI, MSS),
+    # avant tout appel. Même niveau (DPI système) que l'import de PyAutoGUI,
+    # désormais différé, qui s'en chargeait ; fixé avant MSS, qui sinon
+    # passerait le processus en mode par moniteur
+    try:
+        import ctypes as _ctypes
+        _ctypes.windll.user32.SetProcessDPIAware()
+    except Exception as e:
+        logging.warning(f"Impossible d'activer la prise en charge DPI: {e}")
+
     try:
         import win32gui
         import win32ui
@@ -52,15 +73,98 @@ else:  # macOS et autres
     except ImportError:
         MACOS_AVAILABLE = False
 
+# Import optionnel de MSS (capture rapide, instance réutilisable)
+try:
+    import mss
+    MSS_AVAILABLE = True
+except ImportError:
+    MSS_AVAILABLE = False
+
+# Moniteur MSS des captures plein écran : l'écran principal (origine 0, 0, là où
+# s'affiche l'overlay de sélection), sauf sous Linux où l'écran X couvre tous
+# les moniteurs depuis (0, 0) comme la capture PyAutoGUI d'origine
+_FULLSCREEN_MONITOR = 0 if platform.system() == "Linux" else 1
+
+# Import optionnel de PyTurboJPEG (encodage JPEG direct du tampon MSS, sans PIL)
+try:
+    import numpy as np
+    from turbojpeg import TurboJPEG, TJPF_BGRX
+    TURBOJPEG_AVAILABLE = True
+except ImportError:
+    TURBOJPEG_AVAILABLE = False
+
 from core.memory_manager import MemoryManager
 from core.app_detector import AppDetector, AppInfo
 from config.settings import SettingsManager
 
+# Remplace les caractères interdits dans les noms de fichiers en une seule passe
+_SANITIZE_TABLE = str.maketrans({c: '_' for c in '<>:"/\\|?*'})
+_WHITESPACE_RE = re.compile(r'\s+')
+
+# Formats d'enregistrement pris en charge (voir ScreenshotManager._build_savers)
+_SUPPORTED_FORMATS = ('PNG', 'JPEG', 'BMP', 'GIF', 'WEBP')
+
+
+def _no_delay():
+    """Aucun délai avant la capture"""
+
+
+# PyAutoGUI n'est qu'un fallback (MSS, ImageGrab) : import lent, différé
+_pyautogui = None
+
+
+def _get_pyautogui():
+    """Importe et configure PyAutoGUI à la première utilisation"""
+    global _pyautogui
+    if _pyautogui is None:
+        import pyautogui
+        # Lecture seule : aucune pause après les appels
+        pyautogui.PAUSE = 0
+        pyautogui.FAILSAFE = True
+        _pyautogui = pyautogui
+    return _pyautogui
+
+
+def _pyautogui_screenshot(region: Optional[Tuple[int, int, int, int]] = None) -> Image.Image:
+    """Capture via PyAutoGUI (dernier recours)"""
+    return _get_pyautogui().screenshot(region=region)
+
+@dataclass
+class RawFrame:
+    """Pixels BGRX bruts d'une capture MSS, encodés sans passer par PIL"""
+    data: bytearray
+    size: Tuple[int, int]  # largeur, hauteur
+
+    def to_image(self) -> Image.Image:
+        """Convertit la capture brute en image PIL RGB"""
+        return Image.frombuffer('RGB', self.size, self.data, 'raw', 'BGRX', 0, 1)
+
+
+class CaptureStats:
+    """Compteurs de captures (attributs à slots, sans dictionnaire)"""
+
+    __slots__ = ('total_captures', 'successful_captures', 'failed_captures', 'memory_usage_mb')
+
+    def __init__(self):
+        self.total_captures = 0
+        self.successful_captures = 0
+        self.failed_captures = 0
+        self.memory_usage_mb = 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Retourne les compteurs sous forme de dictionnaire"""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
 class AreaSelector:
     """Interface de sélection de zone avec effets visuels d'assombrissement et révélation - CORRIGÉE"""
 
-    def __init__(self):
+    def __init__(self, screen_grabber: Optional[Callable[[], Image.Image]] = None,
+                 image_releaser: Optional[Callable[[Image.Image], None]] = None):
         self.logger = logging.getLogger(__name__)
+        self.screen_grabber = screen_grabber or _pyautogui_screenshot
+        # Rend l'image figée à son propriétaire (pool de tampons) après la sélection
+        self.image_releaser = image_releaser
         self.root = None
         self.canvas = None
         self.selected_area = None
@@ -69,16 +173,40 @@ class AreaSelector:
         self.darkened_screenshot = None  # L'image assombrie
         self.tk_image_dark = None  # Image Tkinter assombrie
         self.tk_image_original = None  # Image Tkinter originale pour la révélation
+        self.tk_image_reveal = None  # Zone révélée, recopiée depuis l'originale par Tk
 
         # Variables pour la sélection
         self.start_x = None
         self.start_y = None
-        self.current_rect = None
         self.selecting = False
         self.selection_confirmed = False
 
+        # Limitation des redessins pendant le glissement (~60 images/s)
+        self.drag_interval = 0.016
+        self._last_drag_ts = 0.0
+        self._pending_drag: Optional[Tuple[int, int]] = None
+        self._drag_after_id = None
+
+        # Éléments du canvas de la sélection, créés une fois puis déplacés
+        self._revealed_id = None
+        self._sel_rect_id = None
+        self._info_bg_id = None
+        self._info_text_id = None
+        self._corner_ids: list = []
+        self._confirm_bg_id = None
+        self._confirm_text_id = None
+        self._instructions_created = False
+
+        # Dimensions de l'écran figé (renseignées à la création de l'interface)
+        self._screen_w = 0
+        self._screen_h = 0
+
+        # Polices Tk nommées (créées avec la fenêtre, réutilisées par tous les textes)
+        self._fonts: Dict[str, tkfont.Font] = {}
+
         # Effet visuel - assombrissement
         self.darken_factor = 0.3  # 30% de luminosité (70% d'assombrissement)
+        self.backdrop_scale = 2  # Fond assombri calculé à 1/2 résolution (1 = pleine)
 
         # Style de l'interface
         self.selection_color = '#00FF00'  # Vert vif pour la sélection
@@ -101,10 +229,7 @@ class AreaSelector:
             # 3. Lancer la boucle d'événements pour la sélection
             self.root.mainloop()
 
-            # 4. Nettoyer les ressources
-            self._cleanup_selection_interface()
-
-            # 5. Retourner les coordonnées ET l'image sélectionnée
+            # 4. Retourner les coordonnées ET l'image sélectionnée
             if self.selected_area and self.selected_image:
                 return (self.selected_area, self.selected_image)
             else:
@@ -112,21 +237,31 @@ class AreaSelector:
 
         except Exception as e:
             self.logger.error(f"Erreur sélection de zone: {e}")
-            self._cleanup_selection_interface()
             return None
 
+        finally:
+            # 5. Nettoyer les ressources (un seul point de destruction de la fenêtre)
+            self._cleanup_selection_interface()
+
     def _prepare_images(self) -> bool:
         """Prépare les images : capture l'écran et crée la version assombrie"""
         try:
             self.logger.info("Capture et préparation des images avec effets...")
 
             # Capture l'écran complet
-            self.frozen_screenshot = pyautogui.screenshot()
+            self.frozen_screenshot = self.screen_grabber()
             self.logger.info(f"Écran capturé: {self.frozen_screenshot.size}")
 
-            # Crée la version assombrie
-            enhancer = ImageEnhance.Brightness(self.frozen_screenshot)
-            self.darkened_screenshot = enhancer.enhance(self.darken_factor)
+            # Fond assombri à résolution réduite (agrandi ensuite par Tk) : c'est
+            # un simple décor, seule la zone révélée doit être nette
+            backdrop = self.frozen_screenshot
+            if self.backdrop_scale > 1:
+                backdrop = backdrop.reduce(self.backdrop_scale)
+
+            # Crée la version assombrie en une passe de table de correspondance
+            # (ImageEnhance mélange avec une image noire plein écran en plus)
+            darken_lut = [int(value * self.darken_factor) for value in range(256)]
+            self.darkened_screenshot = backdrop.point(darken_lut * len(backdrop.getbands()))
             self.logger.info("Version assombrie créée")
 
             return True
@@ -141,8 +276,9 @@ class AreaSelector:
             if not self.frozen_screenshot or not self.darkened_screenshot:
                 return False
 
-            # Obtient les dimensions de l'écran
+            # Obtient les dimensions de l'écran (gardées pour toute la sélection)
             screen_width, screen_height = self.frozen_screenshot.size
+            self._screen_w, self._screen_h = screen_width, screen_height
 
             # Crée la fenêtre principale
             self.root = tk.Tk()
@@ -166,13 +302,30 @@ class AreaSelector:
             )
             self.canvas.pack(fill=tk.BOTH, expand=True)
 
+            # Polices résolues une fois par Tk au lieu d'un tuple à chaque texte
+            self._fonts = {
+                'title': tkfont.Font(self.root, family='Segoe UI', size=16, weight='bold'),
+                'label': tkfont.Font(self.root, family='Segoe UI', size=12, weight='bold'),
+                'hint': tkfont.Font(self.root, family='Segoe UI', size=11),
+            }
+
             # Prépare les images Tkinter avec références fortes
-            self.tk_image_dark = ImageTk.PhotoImage(self.darkened_screenshot, master=self.root)
+            small_dark = ImageTk.PhotoImage(self.darkened_screenshot, master=self.root)
+            if self.backdrop_scale > 1:
+                # Agrandissement par Tk (plus proche voisin, en C) à la taille de l'écran
+                self.tk_image_dark = tk.PhotoImage(master=self.root)
+                self.tk_image_dark.tk.call(
+                    str(self.tk_image_dark), 'copy', str(small_dark),
+                    '-zoom', self.backdrop_scale, self.backdrop_scale
+                )
+                del small_dark
+            else:
+                self.tk_image_dark = small_dark
+            # Les pixels assombris sont maintenant dans Tk : la copie PIL ne sert plus
+            self.darkened_screenshot = None
             self.tk_image_original = ImageTk.PhotoImage(self.frozen_screenshot, master=self.root)
-
-            # Maintient les références fortes pour éviter le garbage collection
-            self.canvas.image_dark = self.tk_image_dark
-            self.canvas.image_original = self.tk_image_original
+            # (les attributs self.tk_image_* gardent les références fortes)
+            self.tk_image_reveal = tk.PhotoImage(master=self.root)
 
             # Affiche l'image assombrie en arrière-plan
             self.canvas.create_image(0, 0, image=self.tk_image_dark, anchor=tk.NW, tags='background_dark')
@@ -196,22 +349,27 @@ class AreaSelector:
         self.canvas.bind('<Button-1>', self._on_click)
         self.canvas.bind('<B1-Motion>', self._on_drag)
         self.canvas.bind('<ButtonRelease-1>', self._on_release)
-        self.canvas.bind('<Motion>', self._on_mouse_move)
 
-        # Événements de clavier
-        self.root.bind('<Escape>', self._cancel_selection)
-        self.root.bind('<Return>', self._confirm_selection)
-        self.root.bind('<space>', self._confirm_selection)
+        # Événements de clavier (le canvas a le focus)
+        self.canvas.bind('<Escape>', self._cancel_selection)
+        self.canvas.bind('<Return>', self._confirm_selection)
+        self.canvas.bind('<space>', self._confirm_selection)
 
         # Focus sur le canvas
         self.canvas.focus_set()
 
     def _show_instructions(self):
         """Affiche les instructions à l'utilisateur avec style moderne"""
-        screen_width = self.frozen_screenshot.size[0]
+        # Déjà créées : simplement réaffichées après une sélection trop petite
+        if self._instructions_created:
+            self.canvas.itemconfigure('instructions', state='normal')
+            return
+        self._instructions_created = True
+
+        screen_width = self._screen_w
 
         # Fond moderne pour les instructions avec bordure arrondie
-        instructions_bg = self.canvas.create_rectangle(
+        self.canvas.create_rectangle(
             20, 20, screen_width - 20, 100,
             fill='#2C3E50', outline='#3498DB', width=2, tags='instructions'
         )
@@ -221,7 +379,7 @@ class AreaSelector:
             screen_width // 2, 45,
             text="🎯 Cliquez et glissez pour révéler et sélectionner une zone à capturer",
             fill='#ECF0F1',
-            font=('Segoe UI', 16, 'bold'),
+            font=self._fonts['title'],
             tags='instructions'
         )
 
@@ -230,7 +388,7 @@ class AreaSelector:
             screen_width // 2, 75,
             text="✨ Entrée/Espace = Capturer • Échap = Annuler • La zone sélectionnée révèle l'image originale",
             fill='#BDC3C7',
-            font=('Segoe UI', 11),
+            font=self._fonts['hint'],
             tags='instructions'
         )
 
@@ -243,8 +401,8 @@ class AreaSelector:
         # Supprime l'ancienne sélection
         self._clear_selection()
 
-        # Supprime les instructions
-        self.canvas.delete('instructions')
+        # Masque les instructions
+        self.canvas.itemconfigure('instructions', state='hidden')
 
         self.logger.debug(f"Début sélection à ({event.x}, {event.y})")
 
@@ -253,16 +411,48 @@ class AreaSelector:
         if not self.selecting:
             return
 
-        # Supprime l'ancienne sélection
-        self._clear_selection()
+        # Les souris haute fréquence envoient des centaines d'événements par
+        # seconde : on ne redessine qu'au rythme d'affichage
+        self._pending_drag = (event.x, event.y)
+        if time.perf_counter() - self._last_drag_ts < self.drag_interval:
+            if self._drag_after_id is None:
+                self._drag_after_id = self.root.after(
+                    int(self.drag_interval * 1000), self._flush_drag
+                )
+            return
 
+        self._flush_drag()
+
+    def _flush_drag(self):
+        """Redessine la sélection avec la dernière position de souris reçue"""
+        self._drag_after_id = None
+        if not self.selecting or self._pending_drag is None:
+            return
+
+        x, y = self._pending_drag
+        self._pending_drag = None
+        self._last_drag_ts = time.perf_counter()
+        self._update_selection(x, y)
+
+    def _cancel_pending_drag(self):
+        """Annule le redessin de glissement en attente"""
+        if self._drag_after_id is not None:
+            try:
+                self.root.after_cancel(self._drag_after_id)
+            except Exception:
+                pass
+            self._drag_after_id = None
+        self._pending_drag = None
+
+    def _update_selection(self, x2: int, y2: int):
+        """Met à jour l'affichage de la sélection jusqu'au point (x2, y2)"""
         # Calcule les coordonnées
         x1, y1 = self.start_x, self.start_y
-        x2, y2 = event.x, event.y
 
-        # Assure l'ordre correct des coordonnées
-        min_x, max_x = min(x1, x2), max(x1, x2)
-        min_y, max_y = min(y1, y2), max(y1, y2)
+        # Assure l'ordre correct des coordonnées (comparaisons directes,
+        # sans appels min/max, à chaque image du glissement)
+        min_x, max_x = (x1, x2) if x1 <= x2 else (x2, x1)
+        min_y, max_y = (y1, y2) if y1 <= y2 else (y2, y1)
 
         width = max_x - min_x
         height = max_y - min_y
@@ -271,34 +461,44 @@ class AreaSelector:
             # Révèle l'image originale dans la zone sélectionnée
             self._reveal_selection_area(min_x, min_y, width, height)
 
-            # Crée le rectangle de sélection avec style moderne
-            self.canvas.create_rectangle(
-                min_x, min_y, max_x, max_y,
-                outline=self.selection_color,
-                width=self.selection_width,
-                tags='selection_border'
-            )
+            # Rectangle de sélection avec style moderne (déplacé, pas recréé)
+            if self._sel_rect_id is None:
+                self._sel_rect_id = self.canvas.create_rectangle(
+                    min_x, min_y, max_x, max_y,
+                    outline=self.selection_color,
+                    width=self.selection_width,
+                    tags='selection_border'
+                )
+            else:
+                self.canvas.coords(self._sel_rect_id, min_x, min_y, max_x, max_y)
+                self.canvas.itemconfigure(self._sel_rect_id, state='normal')
 
             # Affiche les dimensions avec style
             self._show_selection_info(min_x, min_y, width, height)
 
             # Coins de sélection modernes
             self._draw_selection_corners(min_x, min_y, max_x, max_y)
+        else:
+            self._clear_selection()
 
     def _reveal_selection_area(self, x: int, y: int, width: int, height: int):
         """Révèle l'image originale dans la zone sélectionnée"""
         try:
-            # Crée un crop de l'image originale pour la zone sélectionnée
-            selection_crop = self.frozen_screenshot.crop((x, y, x + width, y + height))
-
-            # Convertit en image Tkinter
-            tk_selection = ImageTk.PhotoImage(selection_crop, master=self.root)
+            # Recopie la zone depuis l'image originale déjà chargée dans Tk,
+            # dans la même PhotoImage (ni crop PIL ni nouvelle image par image)
+            self.tk_image_reveal.tk.call(
+                str(self.tk_image_reveal), 'copy', str(self.tk_image_original),
+                '-from', x, y, x + width, y + height, '-to', 0, 0, '-shrink'
+            )
 
             # Affiche la zone révélée par-dessus l'image assombrie
-            self.canvas.create_image(x, y, image=tk_selection, anchor=tk.NW, tags='revealed_area')
-
-            # Stocke la référence pour éviter le garbage collection
-            self.canvas.current_selection_image = tk_selection
+            if self._revealed_id is None:
+                self._revealed_id = self.canvas.create_image(
+                    x, y, image=self.tk_image_reveal, anchor=tk.NW, tags='revealed_area'
+                )
+            else:
+                self.canvas.coords(self._revealed_id, x, y)
+                self.canvas.itemconfigure(self._revealed_id, state='normal')
 
         except Exception as e:
             self.logger.error(f"Erreur révélation zone: {e}")
@@ -307,28 +507,37 @@ class AreaSelector:
         """Affiche les informations de la sélection avec style moderne"""
         # Fond pour les informations
         info_y = max(y - 40, 10)  # Au-dessus de la sélection ou en haut si pas de place
-
-        info_bg = self.canvas.create_rectangle(
-            x + width // 2 - 80, info_y - 5,
-            x + width // 2 + 80, info_y + 25,
-            fill='#34495E', outline='#3498DB', width=1,
-            tags='selection_info'
-        )
+        center_x = x + width // 2
 
         # Texte des dimensions
         info_text = f"📐 {width} × {height} pixels"
-        self.canvas.create_text(
-            x + width // 2, info_y + 10,
-            text=info_text,
-            fill='#ECF0F1',
-            font=('Segoe UI', 12, 'bold'),
-            tags='selection_info'
-        )
+
+        if self._info_bg_id is None:
+            self._info_bg_id = self.canvas.create_rectangle(
+                center_x - 80, info_y - 5,
+                center_x + 80, info_y + 25,
+                fill='#34495E', outline='#3498DB', width=1,
+                tags='selection_info'
+            )
+            self._info_text_id = self.canvas.create_text(
+                center_x, info_y + 10,
+                text=info_text,
+                fill='#ECF0F1',
+                font=self._fonts['label'],
+                tags='selection_info'
+            )
+        else:
+            self.canvas.coords(self._info_bg_id,
+                               center_x - 80, info_y - 5, center_x + 80, info_y + 25)
+            self.canvas.coords(self._info_text_id, center_x, info_y + 10)
+            self.canvas.itemconfigure(self._info_text_id, text=info_text)
+            self.canvas.itemconfigure('selection_info', state='normal')
 
     def _draw_selection_corners(self, min_x: int, min_y: int, max_x: int, max_y: int):
         """Dessine les coins de sélection modernes"""
         corner_size = 8
         corner_thickness = 3
+        half = corner_size // 2
 
         # Coins avec style moderne
         corners = [
@@ -338,26 +547,25 @@ class AreaSelector:
             (max_x, max_y),  # Coin inférieur droit
         ]
 
-        for i, (cx, cy) in enumerate(corners):
-            # Carré central du coin
-            self.canvas.create_rectangle(
-                cx - corner_size//2, cy - corner_size//2,
-                cx + corner_size//2, cy + corner_size//2,
-                fill=self.corner_color, outline=self.selection_color,
-                width=corner_thickness, tags='selection_corners'
-            )
+        if not self._corner_ids:
+            for cx, cy in corners:
+                # Carré central du coin
+                self._corner_ids.append(self.canvas.create_rectangle(
+                    cx - half, cy - half, cx + half, cy + half,
+                    fill=self.corner_color, outline=self.selection_color,
+                    width=corner_thickness, tags='selection_corners'
+                ))
+            return
 
-    def _clear_selection(self):
-        """Supprime tous les éléments de sélection"""
-        self.canvas.delete('selection_border')
-        self.canvas.delete('selection_info')
-        self.canvas.delete('selection_corners')
-        self.canvas.delete('revealed_area')
-        self.canvas.delete('confirmation')
+        for corner_id, (cx, cy) in zip(self._corner_ids, corners):
+            self.canvas.coords(corner_id, cx - half, cy - half, cx + half, cy + half)
+        self.canvas.itemconfigure('selection_corners', state='normal')
 
-        # Libère l'image de sélection courante
-        if hasattr(self.canvas, 'current_selection_image'):
-            delattr(self.canvas, 'current_selection_image')
+    def _clear_selection(self):
+        """Masque tous les éléments de sélection (réutilisés au prochain glissement)"""
+        for tag in ('selection_border', 'selection_info', 'selection_corners',
+                    'revealed_area', 'confirmation'):
+            self.canvas.itemconfigure(tag, state='hidden')
 
     def _on_release(self, event):
         """Fin de la sélection"""
@@ -365,14 +573,15 @@ class AreaSelector:
             return
 
         self.selecting = False
+        self._cancel_pending_drag()
 
         # Calcule les coordonnées finales
         x1, y1 = self.start_x, self.start_y
         x2, y2 = event.x, event.y
 
         # Assure l'ordre correct
-        min_x, max_x = min(x1, x2), max(x1, x2)
-        min_y, max_y = min(y1, y2), max(y1, y2)
+        min_x, max_x = (x1, x2) if x1 <= x2 else (x2, x1)
+        min_y, max_y = (y1, y2) if y1 <= y2 else (y2, y1)
 
         width = max_x - min_x
         height = max_y - min_y
@@ -389,6 +598,9 @@ class AreaSelector:
                 self.logger.error(f"Erreur création image zone: {e}")
                 self.selected_image = None
 
+            # Le dernier redessin limité a pu être annulé : affiche exactement
+            # le rectangle qui vient d'être découpé
+            self._update_selection(event.x, event.y)
             self._show_confirmation()
             self.logger.info(f"Zone sélectionnée: {width}x{height} à ({min_x}, {min_y})")
         else:
@@ -396,10 +608,6 @@ class AreaSelector:
             self._clear_selection()
             self._show_instructions()
 
-    def _on_mouse_move(self, event):
-        """Mouvement de la souris sans clic - peut ajouter des effets de survol"""
-        pass
-
     def _show_confirmation(self):
         """Affiche l'interface de confirmation moderne"""
         if not self.selected_area:
@@ -409,28 +617,38 @@ class AreaSelector:
 
         # Position pour la confirmation
         confirm_y = y + h + 20
-        screen_height = self.frozen_screenshot.size[1]
+        screen_height = self._screen_h
 
         # Ajuste si trop proche du bord
         if confirm_y > screen_height - 80:
             confirm_y = max(y - 60, 10)
 
-        # Fond moderne pour la confirmation
-        self.canvas.create_rectangle(
-            x + w//2 - 200, confirm_y - 15,
-            x + w//2 + 200, confirm_y + 35,
-            fill='#27AE60', outline='#2ECC71', width=2,
-            tags='confirmation'
-        )
+        center_x = x + w // 2
 
-        # Icône et texte de confirmation
-        self.canvas.create_text(
-            x + w//2, confirm_y + 10,
-            text="✨ Zone révélée ! Entrée = Capturer • Échap = Annuler • Clic = Nouvelle sélection",
-            fill='white',
-            font=('Segoe UI', 12, 'bold'),
-            tags='confirmation'
-        )
+        # Éléments créés à la première confirmation, puis déplacés
+        if self._confirm_bg_id is None:
+            # Fond moderne pour la confirmation
+            self._confirm_bg_id = self.canvas.create_rectangle(
+                center_x - 200, confirm_y - 15,
+                center_x + 200, confirm_y + 35,
+                fill='#27AE60', outline='#2ECC71', width=2,
+                tags='confirmation'
+            )
+
+            # Icône et texte de confirmation
+            self._confirm_text_id = self.canvas.create_text(
+                center_x, confirm_y + 10,
+                text="✨ Zone révélée ! Entrée = Capturer • Échap = Annuler • Clic = Nouvelle sélection",
+                fill='white',
+                font=self._fonts['label'],
+                tags='confirmation'
+            )
+            return
+
+        self.canvas.coords(self._confirm_bg_id,
+                           center_x - 200, confirm_y - 15, center_x + 200, confirm_y + 35)
+        self.canvas.coords(self._confirm_text_id, center_x, confirm_y + 10)
+        self.canvas.itemconfigure('confirmation', state='normal')
 
     def _confirm_selection(self, event=None):
         """Confirme la sélection"""
@@ -450,35 +668,47 @@ class AreaSelector:
     def _cleanup_selection_interface(self):
         """Nettoie toutes les ressources de l'interface"""
         try:
+            # Un redessin de glissement peut encore être programmé (Échap en glissant)
             if self.root:
-                self.root.destroy()
-                self.root = None
-
-            # Libère toutes les images Tkinter
-            if self.tk_image_dark:
-                if hasattr(self, 'canvas') and self.canvas:
-                    if hasattr(self.canvas, 'image_dark'):
-                        delattr(self.canvas, 'image_dark')
-                    if hasattr(self.canvas, 'image_original'):
-                        delattr(self.canvas, 'image_original')
-                    if hasattr(self.canvas, 'current_selection_image'):
-                        delattr(self.canvas, 'current_selection_image')
-
-                del self.tk_image_dark
-                self.tk_image_dark = None
+                self._cancel_pending_drag()
 
-            if self.tk_image_original:
-                del self.tk_image_original
-                self.tk_image_original = None
+            # Libère les images Tkinter avant de détruire l'interpréteur :
+            # une PhotoImage supprimée après destroy() n'est jamais libérée par Tk.
+            # Suppression explicite côté Tcl, sans dépendre du finaliseur Python
+            if self.canvas:
+                self.canvas.delete('all')
+            if self.root:
+                for tk_image in (self.tk_image_dark, self.tk_image_original, self.tk_image_reveal):
+                    if tk_image is not None:
+                        try:
+                            self.root.tk.call('image', 'delete', str(tk_image))
+                        except tk.TclError:
+                            pass
+            self.tk_image_dark = None
+            self.tk_image_original = None
+            self.tk_image_reveal = None
+            self._fonts = {}
+
+            # Les identifiants d'éléments n'ont plus de sens sans le canvas
+            self._revealed_id = None
+            self._sel_rect_id = None
+            self._info_bg_id = None
+            self._info_text_id = None
+            self._corner_ids = []
+            self._confirm_bg_id = None
+            self._confirm_text_id = None
+            self._instructions_created = False
+            self.canvas = None
 
-            # Libère les images PIL
-            if self.frozen_screenshot:
-                del self.frozen_screenshot
-                self.frozen_screenshot = None
+            if self.root:
+                self.root.destroy()
+                self.root = None
 
-            if self.darkened_screenshot:
-                del self.darkened_screenshot
-                self.darkened_screenshot = None
+            # Libère les images PIL (l'image figée retourne au pool s'il y en a un)
+            if self.frozen_screenshot is not None and self.image_releaser:
+                self.image_releaser(self.frozen_screenshot)
+            self.frozen_screenshot = None
+            self.darkened_screenshot = None
 
             self.logger.info("Ressources de sélection nettoyées")
 
@@ -762,55 +992,111 @@ class ScreenshotManager:
         self._area_selection_active = False
         self._area_selection_lock = threading.Lock()
 
-        # Configuration PyAutoGUI
-        pyautogui.PAUSE = 0.1
-        pyautogui.FAILSAFE = True
+        # Paramètres de capture en cache (rafraîchis à chaque changement de config)
+        self._cached_settings: Dict[str, Any] = {}
+        self._refresh_cached_settings()
+        self.settings.add_change_callback(self._refresh_cached_settings)
+
+        # Taille de l'écran en cache (calculée à la première utilisation)
+        self._screen_size: Optional[Tuple[int, int]] = None
+
+        # Encodage et écriture disque hors du thread de capture
+        self._save_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="SnapSave")
+        self._save_slots = threading.BoundedSemaphore(4)  # Sauvegardes en cours ou en file
+
+        # Callbacks de notification exécutés dans l'ordre sur un seul thread persistant
+        self._notify_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="SnapNotify")
+
+        # Recompression PNG optimisée en arrière-plan (créée à la demande)
+        self._recompress_pool: Optional[ThreadPoolExecutor] = None
+        # Création paresseuse depuis les deux threads de sauvegarde
+        self._recompress_pool_lock = threading.Lock()
+
+        # Encodeur TurboJPEG optionnel (chargé à la première capture JPEG)
+        self._turbojpeg = None
+        self._turbojpeg_loaded = False
+
+        # Instances MSS par thread (ses handles DC/bitmap Windows sont locaux au
+        # thread créateur) : créées à la première capture de chaque thread
+        self._mss_local = threading.local()
+        self._mss_instances: List[Tuple[threading.Thread, Any]] = []
+        self._mss_lock = threading.Lock()
+
+        # DC et bitmap GDI réutilisés pour les captures de région sans MSS (Windows)
+        self._gdi_region_cache: Optional[tuple] = None
+        self._gdi_lock = threading.Lock()
+
+        # Pool d'images PIL réutilisées entre captures de même taille
+        # (plein écran + une région), clé (largeur, hauteur, mode)
+        self._image_pool: "OrderedDict[Tuple[int, int, str], Image.Image]" = OrderedDict()
+        self._image_pool_lock = threading.Lock()
+        self._image_pool_size = 2
 
         # Cache pour optimisation
-        self._image_cache: Dict[str, weakref.ref] = {}
         self._temp_files: set = set()
+        self._dir_cache: set = set()  # Dossiers de sauvegarde déjà vérifiés
+
+        # Dernier horodatage formaté : (seconde, motif, nom)
+        self._filename_stamp: Tuple[int, Optional[str], str] = (-1, None, '')
 
-        # Callbacks pour les événements
-        self.capture_callbacks: list = []
-        self.error_callbacks: list = []
+        # Dernier nom de base réservé et prochain suffixe à essayer (rafales)
+        self._last_name_counter: Tuple[Optional[str], int] = (None, 1)
+        self._name_counter_lock = threading.Lock()
+
+        # Callbacks pour les événements (tuples remplacés à l'ajout : lecture sans verrou)
+        self.capture_callbacks: Tuple[Callable, ...] = ()
+        self.error_callbacks: Tuple[Callable, ...] = ()
+        # Les notifications et statistiques partent des threads de sauvegarde
+        self._callbacks_lock = threading.Lock()
 
         # Flag pour vérifier si l'application est active
         self._app_active = True
 
+        # Nettoyage mémoire après capture limité dans le temps (rafales)
+        self._last_capture_cleanup = 0.0
+        self._capture_cleanup_interval = 5.0
+
+        # Préparation avant capture limitée dans le temps (rafales)
+        self._last_prepare = 0.0
+        self._prepare_interval = 1.0
+
         # Statistiques
-        self.stats = {
-            'total_captures': 0,
-            'successful_captures': 0,
-            'failed_captures': 0,
-            'memory_usage_mb': 0
-        }
+        self.stats = CaptureStats()
 
         self.logger.info("ScreenshotManager initialisé avec capture universelle de fenêtre")
 
+        # Préchauffe le backend de capture pour accélérer la première capture
+        threading.Thread(target=self._warmup_capture_backend, daemon=True,
+                         name="CaptureWarmup").start()
+
     def capture_fullscreen(self, save_path: Optional[str] = None,
                            folder_override: Optional[str] = None) -> Optional[str]:
-        """Capture l'écran entier"""
+        """Capture l'écran entier
+
+        Le chemin retourné est provisoire : l'image est écrite en arrière-plan
+        et peut finalement l'être ailleurs (repli PNG si le format échoue).
+        Le chemin définitif est transmis aux callbacks de capture.
+        """
         try:
             self.logger.info("Début capture plein écran")
             self._prepare_capture()
 
             # Délai configurable
-            delay = self.settings.get_capture_settings().get('delay_seconds', 0)
-            if delay > 0:
-                time.sleep(delay)
+            self._capture_delay()
 
             # Capture avec optimisation mémoire
             with self._memory_optimized_capture():
-                screenshot = pyautogui.screenshot()
+                # En JPEG (TurboJPEG) ou BMP, le tampon MSS est écrit sans passer par PIL
+                if self._use_raw_capture_path():
+                    screenshot = self._grab_screen_raw()
+                else:
+                    screenshot = self._grab_screen()
 
-                # Conversion et sauvegarde
-                save_path = self._process_and_save_image(
-                    screenshot, save_path, folder_override, "fullscreen"
+                # Conversion et sauvegarde (en arrière-plan)
+                save_path = self._save_image_async(
+                    screenshot, save_path, folder_override, "fullscreen", "fullscreen"
                 )
 
-            self._update_stats(True)
-            self._notify_capture_complete("fullscreen", save_path)
-
             return save_path
 
         except Exception as e:
@@ -821,7 +1107,12 @@ class ScreenshotManager:
 
     def capture_active_window(self, save_path: Optional[str] = None,
                               folder_override: Optional[str] = None) -> Optional[str]:
-        """Capture UNIVERSELLE de la fenêtre active - CORRIGÉ POUR TOUTES LES APPS avec dialogue de choix"""
+        """Capture UNIVERSELLE de la fenêtre active - CORRIGÉ POUR TOUTES LES APPS avec dialogue de choix
+
+        Le chemin retourné est provisoire : l'image est écrite en arrière-plan
+        et peut finalement l'être ailleurs (repli PNG si le format échoue).
+        Le chemin définitif est transmis aux callbacks de capture.
+        """
         try:
             self.logger.info("Début capture fenêtre active - VERSION UNIVERSELLE avec choix de dossier")
             self._prepare_capture()
@@ -844,16 +1135,30 @@ class ScreenshotManager:
                     return None
 
             # Délai configurable
-            delay = self.settings.get_capture_settings().get('delay_seconds', 0)
-            if delay > 0:
-                time.sleep(delay)
+            self._capture_delay()
 
             # MÉTHODE UNIVERSELLE DE CAPTURE
             with self._memory_optimized_capture():
                 screenshot = None
 
+                # Méthode 0 : application plein écran - la fenêtre couvre son écran,
+                # une seule capture de ce rectangle. Image PIL pour pouvoir la
+                # valider : un jeu DirectX/OpenGL exclusif revient noir et doit
+                # passer par les méthodes suivantes
+                if current_app.is_fullscreen and self._validate_window_coordinates(*current_app.window_rect):
+                    region = tuple(current_app.window_rect)
+                    try:
+                        grabbed = self._grab_screen(region)
+                        if self._is_image_valid(grabbed):
+                            screenshot = grabbed
+                            self.logger.info("Capture directe de l'application plein écran")
+                        else:
+                            self.logger.info("Capture directe plein écran invalide (noire), méthodes suivantes")
+                    except Exception as e:
+                        self.logger.warning(f"Capture directe plein écran impossible: {e}")
+
                 # Méthode 1 : PrintWindow API (Windows) - LA PLUS EFFICACE
-                if WINDOWS_AVAILABLE and platform.system() == "Windows":
+                if screenshot is None and WINDOWS_AVAILABLE and platform.system() == "Windows":
                     screenshot = self._capture_window_printwindow(current_app)
                     if screenshot:
                         self.logger.info("Capture PrintWindow réussie")
@@ -873,19 +1178,17 @@ class ScreenshotManager:
                 # Méthode 4 : Fallback capture d'écran complète
                 if screenshot is None:
                     self.logger.warning("Toutes les méthodes spécialisées ont échoué - Capture plein écran")
-                    screenshot = pyautogui.screenshot()
+                    screenshot = self._grab_screen()
 
                 # Sauvegarde avec nom incluant l'app
                 filename_prefix = f"{current_app.name}_{current_app.window_title}"
                 filename_prefix = self._sanitize_filename(filename_prefix)
 
-                save_path = self._process_and_save_image(
-                    screenshot, save_path, folder_override, filename_prefix
+                save_path = self._save_image_async(
+                    screenshot, save_path, folder_override, filename_prefix,
+                    "window", current_app
                 )
 
-            self._update_stats(True)
-            self._notify_capture_complete("window", save_path, current_app)
-
             return save_path
 
         except Exception as e:
@@ -894,6 +1197,47 @@ class ScreenshotManager:
             self._notify_error("window", str(e))
             return None
 
+    def capture_batch(self, count: int, interval: float = 0.0,
+                      region: Optional[Tuple[int, int, int, int]] = None,
+                      folder_override: Optional[str] = None) -> List[str]:
+        """Capture une rafale d'images (écran ou région x, y, w, h) et retourne les chemins sauvegardés
+
+        Les captures réutilisent l'instance MSS du thread appelant et sont encodées en
+        parallèle sur le pool de sauvegarde pendant que la rafale continue.
+        """
+        pending = []
+        try:
+            self.logger.info(f"Début capture en rafale: {count} images, intervalle {interval}s")
+            self._prepare_capture()
+            self._capture_delay()
+
+            use_raw = self._use_raw_capture_path()
+
+            with self._memory_optimized_capture():
+                for index in range(count):
+                    if index and interval > 0:
+                        time.sleep(interval)
+
+                    screenshot = self._grab_screen_raw(region) if use_raw else self._grab_screen(region)
+                    pending.append(self._submit_save(
+                        screenshot, None, folder_override, "burst", "burst"
+                    )[1])
+
+        except Exception as e:
+            self.logger.error(f"Erreur capture en rafale: {e}")
+            self._update_stats(False)
+            self._notify_error("burst", str(e))
+
+        # Attend la fin des sauvegardes (stats et callbacks gérés par _submit_save)
+        saved_paths = []
+        for future in pending:
+            try:
+                saved_paths.append(future.result())
+            except Exception:
+                pass
+
+        return saved_paths
+
     def _get_or_choose_app_folder(self, app_info: AppInfo) -> Optional[str]:
         """Récupère ou fait choisir le dossier pour une application - VERSION SIMPLIFIÉE"""
         try:
@@ -1037,12 +1381,25 @@ class ScreenshotManager:
                 return None
 
             # Assure que la fenêtre est visible et au premier plan
+            state_changed = False
             if win32gui.IsIconic(hwnd):
                 win32gui.ShowWindow(hwnd, win32con.SW_RESTORE)
+                # IsIconic retombe dès le retour de ShowWindow : délai fixe
+                # pour laisser l'animation de restauration et le repaint finir
                 time.sleep(0.1)
+                state_changed = True
+
+            if win32gui.GetForegroundWindow() != hwnd:
+                win32gui.SetForegroundWindow(hwnd)
+                self._wait_until(lambda: win32gui.GetForegroundWindow() == hwnd)
+                state_changed = True
 
-            win32gui.SetForegroundWindow(hwnd)
-            time.sleep(0.1)
+            if state_changed:
+                # Repaint synchrone avant la capture (contenu à jour)
+                win32gui.RedrawWindow(hwnd, None, None,
+                                      win32con.RDW_FRAME | win32con.RDW_INVALIDATE
+                                      | win32con.RDW_UPDATENOW | win32con.RDW_ALLCHILDREN)
+                win32gui.UpdateWindow(hwnd)
 
             # Crée le contexte de périphérique
             hwnd_dc = win32gui.GetWindowDC(hwnd)
@@ -1197,7 +1554,7 @@ class ScreenshotManager:
                 return None
 
             # Assure que la région n'est pas hors écran
-            screen_width, screen_height = pyautogui.size()
+            screen_width, screen_height = self._get_screen_size()
             x = max(0, min(x, screen_width - width))
             y = max(0, min(y, screen_height - height))
             width = min(width, screen_width - x)
@@ -1205,8 +1562,8 @@ class ScreenshotManager:
 
             self.logger.info(f"Capture région: x={x}, y={y}, w={width}, h={height}")
 
-            # Capture avec pyautogui
-            screenshot = pyautogui.screenshot(region=(x, y, width, height))
+            # Capture de la région
+            screenshot = self._grab_screen((x, y, width, height))
 
             if self._is_image_valid(screenshot):
                 self.logger.info(f"Capture région réussie: {width}x{height}")
@@ -1219,6 +1576,194 @@ class ScreenshotManager:
 
         return None
 
+    def _grab_screen(self, region: Optional[Tuple[int, int, int, int]] = None) -> Image.Image:
+        """Capture l'écran (ou une région x, y, w, h) via MSS, ou ImageGrab/PyAutoGUI en fallback"""
+        if not MSS_AVAILABLE:
+            if platform.system() == "Windows" and WINDOWS_AVAILABLE:
+                # Sous Windows, BitBlt de la seule région plutôt que plein écran + crop
+                if region is not None:
+                    try:
+                        return self._grab_region_bitblt(region)
+                    except Exception as e:
+                        self.logger.warning(f"Erreur capture région BitBlt, fallback ImageGrab: {e}")
+                return self._grab_imagegrab(region)
+            return _pyautogui_screenshot(region)
+
+        shot = self._grab_mss(region)
+
+        # Décodage BGRX -> RGB
+        image = self._acquire_pooled_image(shot.size, 'RGB')
+        if image is not None:
+            # Réutilise la mémoire déjà allouée d'une capture précédente
+            image.frombytes(shot.raw, 'raw', 'BGRX')
+            return image
+
+        return Image.frombuffer('RGB', shot.size, shot.raw, 'raw', 'BGRX', 0, 1)
+
+    def _grab_imagegrab(self, region: Optional[Tuple[int, int, int, int]] = None) -> Image.Image:
+        """Capture via ImageGrab sans l'enveloppe PyAutoGUI (Windows)"""
+        if region is None:
+            # Écran principal seul, comme MSS (_FULLSCREEN_MONITOR) et l'overlay
+            return ImageGrab.grab(include_layered_windows=False)
+
+        # Région en coordonnées écran : tous les écrans pour les fenêtres
+        # placées sur un moniteur secondaire (origine éventuellement négative)
+        x, y, width, height = region
+        return ImageGrab.grab(bbox=(x, y, x + width, y + height),
+                              all_screens=True, include_layered_windows=False)
+
+    def _grab_region_bitblt(self, region: Tuple[int, int, int, int]) -> Image.Image:
+        """Capture une région de l'écran par BitBlt dans un bitmap à sa taille (Windows)"""
+        x, y, width, height = region
+
+        with self._gdi_lock:
+            # Réutilise le DC et le bitmap de la capture précédente si même taille
+            if self._gdi_region_cache is None or self._gdi_region_cache[0] != (width, height):
+                self._release_gdi_region_cache()
+
+                screen_dc = win32gui.GetDC(0)
+                mfc_dc = win32ui.CreateDCFromHandle(screen_dc)
+                mem_dc = mfc_dc.CreateCompatibleDC()
+                bitmap = win32ui.CreateBitmap()
+                bitmap.CreateCompatibleBitmap(mfc_dc, width, height)
+                mem_dc.SelectObject(bitmap)
+                self._gdi_region_cache = ((width, height), screen_dc, mfc_dc, mem_dc, bitmap)
+
+            _, _, mfc_dc, mem_dc, bitmap = self._gdi_region_cache
+            mem_dc.BitBlt((0, 0), (width, height), mfc_dc, (x, y), win32con.SRCCOPY)
+            bits = bitmap.GetBitmapBits(True)
+
+        return Image.frombuffer('RGB', (width, height), bits, 'raw', 'BGRX', 0, 1)
+
+    def _release_gdi_region_cache(self):
+        """Libère le DC et le bitmap GDI mis en cache pour les captures de région"""
+        if self._gdi_region_cache is None:
+            return
+
+        _, screen_dc, mfc_dc, mem_dc, bitmap = self._gdi_region_cache
+        self._gdi_region_cache = None
+        try:
+            win32gui.DeleteObject(bitmap.GetHandle())
+            mem_dc.DeleteDC()
+            mfc_dc.DeleteDC()
+            win32gui.ReleaseDC(0, screen_dc)
+        except Exception as e:
+            self.logger.error(f"Erreur libération ressources GDI: {e}")
+
+    def _grab_screen_raw(self, region: Optional[Tuple[int, int, int, int]] = None) -> RawFrame:
+        """Capture l'écran via MSS et retourne les pixels bruts, sans conversion PIL"""
+        shot = self._grab_mss(region)
+        return RawFrame(shot.raw, shot.size)
+
+    def _get_mss(self):
+        """Retourne l'instance MSS du thread courant (créée à sa première capture)"""
+        sct = getattr(self._mss_local, 'sct', None)
+        if sct is None:
+            sct = mss.mss()
+            self._mss_local.sct = sct
+            with self._mss_lock:
+                # Libère les instances des threads terminés (callbacks de hotkey)
+                alive = []
+                for thread, instance in self._mss_instances:
+                    if thread.is_alive():
+                        alive.append((thread, instance))
+                    else:
+                        self._close_mss_instance(instance)
+                alive.append((threading.current_thread(), sct))
+                self._mss_instances = alive
+        return sct
+
+    def _grab_mss(self, region: Optional[Tuple[int, int, int, int]] = None):
+        """Capture via l'instance MSS du thread courant"""
+        sct = self._get_mss()
+
+        if region is None:
+            monitor = sct.monitors[_FULLSCREEN_MONITOR]
+        else:
+            x, y, width, height = region
+            monitor = {'left': x, 'top': y, 'width': width, 'height': height}
+
+        return sct.grab(monitor)
+
+    def _warmup_capture_backend(self):
+        """Initialise le backend de capture (écran, bibliothèques) avec une capture 1x1"""
+        try:
+            self._get_screen_size()
+            # Charge les bibliothèques de capture sans créer l'instance MSS
+            # d'un autre thread (chaque thread de capture a la sienne)
+            self._probe_capture_backend()
+            self.logger.debug("Backend de capture préchauffé")
+        except Exception as e:
+            self.logger.debug(f"Préchauffage du backend de capture impossible: {e}")
+
+    def _probe_capture_backend(self):
+        """Capture 1x1 avec une instance MSS temporaire, ouverte et fermée sur ce thread
+
+        N'installe pas d'instance durable sur le thread appelant (interface,
+        préchauffage), qui ne fait pas les captures réelles.
+        """
+        if MSS_AVAILABLE:
+            with mss.mss() as sct:
+                sct.grab({'left': 0, 'top': 0, 'width': 1, 'height': 1})
+        else:
+            self._grab_screen((0, 0, 1, 1))
+
+    def _get_turbojpeg(self):
+        """Retourne l'encodeur TurboJPEG (chargé à la première utilisation) ou None"""
+        if not self._turbojpeg_loaded:
+            self._turbojpeg_loaded = True
+            if TURBOJPEG_AVAILABLE:
+                try:
+                    self._turbojpeg = TurboJPEG()
+                except Exception as e:
+                    self.logger.warning(f"Bibliothèque libjpeg-turbo indisponible: {e}")
+        return self._turbojpeg
+
+    def _use_raw_capture_path(self) -> bool:
+        """Indique si la capture peut être écrite directement depuis le tampon MSS"""
+        image_format, _, _, save_raw_fn = self._savers
+        if not MSS_AVAILABLE or save_raw_fn is None:
+            return False
+
+        # JPEG direct : seulement si libjpeg-turbo a pu être chargée
+        return image_format != 'JPEG' or self._get_turbojpeg() is not None
+
+    def _acquire_pooled_image(self, size: Tuple[int, int], mode: str) -> Optional[Image.Image]:
+        """Retire du pool une image de la taille demandée, si disponible"""
+        with self._image_pool_lock:
+            return self._image_pool.pop((size[0], size[1], mode), None)
+
+    def _release_image(self, image: Image.Image):
+        """Rend une image au pool une fois sauvegardée (éviction LRU)"""
+        if not isinstance(image, Image.Image):
+            return
+
+        try:
+            key = (image.size[0], image.size[1], image.mode)
+        except Exception:
+            return
+
+        with self._image_pool_lock:
+            self._image_pool[key] = image
+            self._image_pool.move_to_end(key)
+            while len(self._image_pool) > self._image_pool_size:
+                self._image_pool.popitem(last=False)
+
+    def _close_mss(self):
+        """Libère toutes les instances MSS"""
+        with self._mss_lock:
+            instances, self._mss_instances = self._mss_instances, []
+            for _, instance in instances:
+                self._close_mss_instance(instance)
+        self._mss_local = threading.local()
+
+    def _close_mss_instance(self, instance):
+        """Ferme une instance MSS (au mieux depuis un autre thread que le sien)"""
+        try:
+            instance.close()
+        except Exception as e:
+            self.logger.error(f"Erreur fermeture MSS: {e}")
+
     def _find_main_window_by_pid(self, pid: int) -> Optional[int]:
         """Trouve la fenêtre principale d'un processus par PID"""
         if not WINDOWS_AVAILABLE:
@@ -1255,6 +1800,16 @@ class ScreenshotManager:
 
         return main_window
 
+    @staticmethod
+    def _wait_until(condition: Callable[[], bool], timeout: float = 0.1, step: float = 0.01) -> bool:
+        """Attend qu'une condition soit vraie, au plus timeout secondes"""
+        deadline = time.monotonic() + timeout
+        while not condition():
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(step)
+        return True
+
     def _is_image_valid(self, image: Image.Image) -> bool:
         """Vérifie qu'une image n'est pas complètement noire ou invalide"""
         try:
@@ -1288,7 +1843,7 @@ class ScreenshotManager:
                 return False
 
             # Vérifie que la fenêtre n'est pas trop grande (plus grande que l'écran)
-            screen_width, screen_height = pyautogui.size()
+            screen_width, screen_height = self._get_screen_size()
             if width > screen_width * 2 or height > screen_height * 2:
                 return False
 
@@ -1300,7 +1855,12 @@ class ScreenshotManager:
 
     def capture_area_selection(self, save_path: Optional[str] = None,
                                folder_override: Optional[str] = None) -> Optional[str]:
-        """Capture une zone sélectionnée avec protection contre les lancements multiples - CORRIGÉ"""
+        """Capture une zone sélectionnée avec protection contre les lancements multiples - CORRIGÉ
+
+        Le chemin retourné est provisoire : l'image est écrite en arrière-plan
+        et peut finalement l'être ailleurs (repli PNG si le format échoue).
+        Le chemin définitif est transmis aux callbacks de capture.
+        """
         # Protection contre les lancements multiples
         with self._area_selection_lock:
             if self._area_selection_active:
@@ -1315,7 +1875,7 @@ class ScreenshotManager:
             self._prepare_capture()
 
             # Interface de sélection avec effets visuels - CORRIGÉE
-            selector = AreaSelector()
+            selector = AreaSelector(self._grab_screen, self._release_image)
             selection_result = selector.select_area()
 
             if not selection_result:
@@ -1333,13 +1893,10 @@ class ScreenshotManager:
                 # CORRECTION: Utilise l'image croppée de l'interface au lieu de faire une nouvelle capture
                 screenshot = cropped_image
 
-                save_path = self._process_and_save_image(
-                    screenshot, save_path, folder_override, "area_selection"
+                save_path = self._save_image_async(
+                    screenshot, save_path, folder_override, "area_selection", "area"
                 )
 
-            self._update_stats(True)
-            self._notify_capture_complete("area", save_path)
-
             return save_path
 
         except Exception as e:
@@ -1355,7 +1912,7 @@ class ScreenshotManager:
             self.logger.debug("Verrou de sélection de zone libéré")
 
     def capture_app_direct(self, app_name: str, save_path: Optional[str] = None) -> Optional[str]:
-        """Capture directe d'une application spécifique"""
+        """Capture directe d'une application spécifique (chemin provisoire, voir capture_active_window)"""
         try:
             self.logger.info(f"Début capture directe app: {app_name}")
             self._prepare_capture()
@@ -1384,78 +1941,237 @@ class ScreenshotManager:
         """Vérifie si une sélection de zone est active"""
         return self._area_selection_active
 
+    def _refresh_cached_settings(self):
+        """Recharge les paramètres de capture utilisés à chaque capture"""
+        capture_settings = self.settings.get_capture_settings()
+        self._cached_settings = {
+            'delay_seconds': capture_settings.get('delay_seconds', 0),
+            'image_format': capture_settings.get('image_format', 'PNG'),
+            'image_quality': capture_settings.get('image_quality', 95),
+            'filename_pattern': capture_settings.get('filename_pattern', 'Screenshot_%Y%m%d_%H%M%S'),
+            'png_compress_level': capture_settings.get('png_compress_level', 1),
+            'background_recompress': capture_settings.get('background_recompress', False),
+            'use_mmap_output': capture_settings.get('use_mmap_output', False)
+        }
+        self._build_savers()
+
+    def _build_savers(self):
+        """Spécialise le délai et les fonctions de sauvegarde pour la configuration actuelle"""
+        delay = self._cached_settings['delay_seconds']
+        self._capture_delay = partial(time.sleep, delay) if delay > 0 else _no_delay
+
+        image_format = self._cached_settings['image_format'].upper()
+        quality = self._cached_settings['image_quality']
+
+        png_level = self._cached_settings['png_compress_level']
+
+        if image_format == 'JPEG':
+            # optimize ne vaut le coût qu'aux qualités où il réduit vraiment la taille ;
+            # baseline 4:2:0 : chemin le plus rapide de libjpeg-turbo
+            save_kwargs = {'quality': quality, 'optimize': quality < 90,
+                           'progressive': False, 'subsampling': 2}
+        elif image_format == 'PNG':
+            # Compression rapide par défaut (1) : le mode optimize est très
+            # coûteux sur les captures et ne fait gagner que quelques pourcents
+            save_kwargs = {'compress_level': png_level}
+        elif image_format == 'WEBP':
+            # WebP sans perte : encodage plus rapide et fichiers plus petits
+            # que PNG sur les captures d'écran (method 4 = compromis vitesse/taille)
+            save_kwargs = {'lossless': True, 'method': 4}
+        else:
+            save_kwargs = {}
+
+        # Sauvegarde d'une image PIL
+        save_fn = partial(self._write_encoded_image,
+                          image_format=image_format, save_kwargs=save_kwargs)
+
+        # Sauvegarde directe d'une capture brute MSS (BMP, ou JPEG via TurboJPEG)
+        if image_format == 'BMP':
+            save_raw_fn = self._write_raw_bmp
+        elif image_format == 'JPEG' and TURBOJPEG_AVAILABLE:
+            save_raw_fn = partial(self._write_raw_jpeg, quality=quality)
+        else:
+            save_raw_fn = None
+
+        extension = 'jpg' if image_format == 'JPEG' else image_format.lower()
+
+        # Publication en une seule affectation : une sauvegarde concurrente lit
+        # toujours un format, une extension et des encodeurs cohérents
+        self._savers = (image_format, extension, save_fn, save_raw_fn)
+
+    def _get_screen_size(self) -> Tuple[int, int]:
+        """Retourne la taille de l'écran principal (mise en cache)"""
+        if self._screen_size is None:
+            if platform.system() == "Windows" and WINDOWS_AVAILABLE:
+                # Appel système direct, sans passer par pyautogui ni Tk
+                self._screen_size = (windll.user32.GetSystemMetrics(0),
+                                     windll.user32.GetSystemMetrics(1))
+            else:
+                self._screen_size = tuple(_get_pyautogui().size())
+        return self._screen_size
+
     def _prepare_capture(self):
-        """Prépare l'environnement pour la capture"""
+        """Prépare l'environnement pour la capture (au plus une fois par intervalle)"""
+        # En rafale, la préparation de la capture précédente est encore valable
+        now = time.monotonic()
+        if now - self._last_prepare < self._prepare_interval:
+            return
+        self._last_prepare = now
+
         # Optimisation mémoire préventive
         self.memory_manager.optimize_for_screenshots()
 
-        # Nettoyage du cache d'images
-        self._cleanup_image_cache()
-
-        # Nettoyage des fichiers temporaires
-        self._cleanup_temp_files()
+        # Nettoyage des fichiers temporaires, hors du thread de capture
+        if self._temp_files:
+            self._save_pool.submit(self._cleanup_temp_files)
 
+    @contextmanager
     def _memory_optimized_capture(self):
         """Context manager pour optimiser la mémoire durant la capture"""
-        class MemoryOptimizedContext:
-            def __init__(self, manager):
-                self.manager = manager
-                self.initial_memory = manager.memory_manager.get_current_memory_usage()
+        memory_manager = self.memory_manager
+        # Les relevés RSS ne servent qu'à l'avertissement : on s'en passe
+        # si les warnings sont filtrés (une lecture /proc ou psutil en moins)
+        measure = self.logger.isEnabledFor(logging.WARNING)
+        initial_memory = memory_manager.get_current_memory_usage() if measure else 0.0
 
-            def __enter__(self):
-                return self
+        try:
+            yield
+        finally:
+            final_memory = memory_manager.get_current_memory_usage() if measure else 0.0
+
+            # Nettoyage après capture, au plus toutes les quelques secondes sauf
+            # forte hausse mémoire (laisse l'allocateur « chaud » en rafale)
+            now = time.monotonic()
+            if (now - self._last_capture_cleanup > self._capture_cleanup_interval
+                    or final_memory > initial_memory + 200):
+                memory_manager.force_cleanup()
+                self._last_capture_cleanup = now
+                if measure:
+                    final_memory = memory_manager.get_current_memory_usage()
+
+            if measure:
+                self.stats.memory_usage_mb = final_memory
+
+                if final_memory > initial_memory + 100:  # Seuil de 100MB
+                    self.logger.warning(
+                        f"Consommation mémoire élevée après capture: {final_memory:.1f}MB"
+                    )
 
-            def __exit__(self, exc_type, exc_val, exc_tb):
-                # Force le nettoyage après capture
-                self.manager.memory_manager.force_cleanup()
+    def _save_image_async(self, image: Image.Image, save_path: Optional[str],
+                          folder_override: Optional[str], prefix: str, capture_type: str,
+                          app_info: Optional[AppInfo] = None) -> str:
+        """Détermine le chemin de sauvegarde puis encode et écrit l'image en arrière-plan
+
+        Retourne immédiatement le chemin de sauvegarde : celui fourni, ou un
+        nom généré et réservé sur le disque (fichier encore vide, abandonné
+        si la sauvegarde se replie sur PNG). Les statistiques et les
+        callbacks de capture, qui reçoivent le chemin définitif, sont
+        déclenchés à la fin de l'écriture.
+        """
+        save_path, _ = self._submit_save(image, save_path, folder_override, prefix,
+                                         capture_type, app_info)
+        return save_path
+
+    def _submit_save(self, image: Image.Image, save_path: Optional[str],
+                     folder_override: Optional[str], prefix: str, capture_type: str,
+                     app_info: Optional[AppInfo] = None) -> Tuple[str, Future]:
+        """Soumet la sauvegarde au pool et retourne le chemin de sauvegarde et le Future"""
+        # Fichier créé par _generate_filename, seul fichier à nettoyer en cas d'échec
+        # (un chemin fourni par l'appelant n'est pas réservé)
+        reserved_path = None
+        # Format figé pour toute la sauvegarde (nom réservé et encodage)
+        savers = self._savers
+        try:
+            # Matérialise l'image sur le thread de capture : le worker ne
+            # doit jamais décoder une image paresseuse partagée
+            if isinstance(image, Image.Image):
+                image.load()
 
-                final_memory = self.manager.memory_manager.get_current_memory_usage()
-                self.manager.stats['memory_usage_mb'] = final_memory
+            if not save_path:
+                save_path = self._generate_filename(folder_override, prefix, savers[1])
+                reserved_path = save_path
+        except Exception:
+            self._release_image(image)
+            raise
 
-                if final_memory > self.initial_memory + 100:  # Seuil de 100MB
-                    self.manager.logger.warning(
-                        f"Consommation mémoire élevée après capture: {final_memory:.1f}MB"
-                    )
+        # Nombre de sauvegardes en attente borné : en rafale, la capture attend
+        # qu'une place se libère au lieu d'accumuler des images en mémoire
+        self._save_slots.acquire()
+        try:
+            future = self._save_pool.submit(
+                self._process_and_save_image, image, save_path, folder_override, prefix,
+                reserved_path, savers
+            )
+        except Exception:
+            self._save_slots.release()
+            self._release_image(image)
+            if reserved_path:
+                self._discard_reserved_file(reserved_path)
+            raise
+
+        def on_saved(done_future):
+            self._save_slots.release()
+            try:
+                final_path = done_future.result()
+            except Exception as e:
+                self._update_stats(False)
+                self._notify_error(capture_type, str(e))
+                return
 
-        return MemoryOptimizedContext(self)
+            self._update_stats(True)
+            self._notify_capture_complete(capture_type, final_path, app_info)
+
+        future.add_done_callback(on_saved)
+        return save_path, future
 
     def _process_and_save_image(self, image: Image.Image, save_path: Optional[str],
-                                folder_override: Optional[str], prefix: str) -> str:
+                                folder_override: Optional[str], prefix: str,
+                                reserved_path: Optional[str] = None,
+                                savers: Optional[tuple] = None) -> str:
         """Traite et sauvegarde l'image avec optimisations"""
         try:
-            # Détermine le chemin de sauvegarde
+            # Fonctions de sauvegarde spécialisées pour le format configuré
+            # (une seule lecture : le tuple est remplacé d'un bloc)
+            image_format, extension, save_fn, save_raw_fn = savers or self._savers
+
+            # Sans chemin fourni, génère un nom et le réserve sur le disque
             if not save_path:
-                save_path = self._generate_filename(folder_override, prefix)
+                save_path = self._generate_filename(folder_override, prefix, extension)
+                reserved_path = save_path
 
             # S'assure que le dossier existe
-            save_dir = Path(save_path).parent
-            save_dir.mkdir(parents=True, exist_ok=True)
+            self._ensure_directory(Path(save_path).parent)
 
-            # Configuration de la sauvegarde
-            capture_settings = self.settings.get_capture_settings()
-            image_format = capture_settings.get('image_format', 'PNG')
-            quality = capture_settings.get('image_quality', 95)
-
-            # Sauvegarde optimisée
-            save_kwargs = {}
-            if image_format.upper() == 'JPEG':
-                save_kwargs['quality'] = quality
-                save_kwargs['optimize'] = True
-            elif image_format.upper() == 'PNG':
-                save_kwargs['optimize'] = True
+            # Capture brute MSS : BMP ou JPEG direct, sinon conversion en image PIL
+            raw_written = False
+            if isinstance(image, RawFrame):
+                if save_raw_fn is not None:
+                    try:
+                        save_raw_fn(image, save_path)
+                        raw_written = True
+                    except Exception as raw_error:
+                        self.logger.warning(f"Erreur écriture directe {image_format}, fallback PIL: {raw_error}")
+                if not raw_written:
+                    image = image.to_image()
 
             # Sauvegarde avec gestion d'erreur
+            saved_as_png = image_format == 'PNG'
             try:
-                image.save(save_path, format=image_format, **save_kwargs)
+                if not raw_written:
+                    save_fn(image, save_path)
             except Exception as save_error:
                 # Fallback en PNG
                 self.logger.warning(f"Erreur sauvegarde {image_format}, fallback PNG: {save_error}")
                 save_path = save_path.rsplit('.', 1)[0] + '.png'
-                image.save(save_path, format='PNG', optimize=True)
+                self._write_encoded_image(image, save_path, 'PNG',
+                                          {'compress_level': self._cached_settings['png_compress_level']})
+                saved_as_png = True
+                if reserved_path and reserved_path != save_path:
+                    self._discard_reserved_file(reserved_path)
 
-            # Enregistre dans le cache avec weak reference
-            cache_key = f"{prefix}_{int(time.time())}"
-            self._image_cache[cache_key] = weakref.ref(image)
+            # Recompression optimisée hors du chemin de capture si demandée
+            if saved_as_png and self._cached_settings['background_recompress']:
+                self._schedule_png_recompress(save_path)
 
             # Nettoie le chemin pour les logs (évite les erreurs d'encodage)
             safe_path = self._clean_path_for_logging(save_path)
@@ -1464,10 +2180,106 @@ class ScreenshotManager:
 
         except Exception as e:
             self.logger.error(f"Erreur traitement image: {e}")
+            if reserved_path:
+                self._discard_reserved_file(reserved_path)
             raise
         finally:
-            # Libère l'image de la mémoire
-            del image
+            # Rend l'image au pool pour la prochaine capture de même taille
+            self._release_image(image)
+
+    def _write_encoded_image(self, image: Image.Image, path: str, image_format: str,
+                             save_kwargs: Dict[str, Any]):
+        """Encode l'image en mémoire puis l'écrit sur le disque en un seul bloc"""
+        buffer = io.BytesIO()
+        image.save(buffer, format=image_format, **save_kwargs)
+
+        with buffer.getbuffer() as data:
+            self._write_file_data(path, data)
+
+    def _write_raw_jpeg(self, frame: RawFrame, path: str, quality: int):
+        """Encode une capture brute BGRX en JPEG avec TurboJPEG et l'écrit sur le disque"""
+        turbojpeg = self._get_turbojpeg()
+        if turbojpeg is None:
+            raise RuntimeError("Encodeur TurboJPEG indisponible")
+
+        width, height = frame.size
+        # Vue numpy sur le tampon MSS, sans copie
+        pixels = np.frombuffer(frame.data, dtype=np.uint8).reshape(height, width, 4)
+        data = turbojpeg.encode(pixels, quality=quality, pixel_format=TJPF_BGRX)
+        self._write_file_data(path, memoryview(data))
+
+    def _write_raw_bmp(self, frame: RawFrame, path: str):
+        """Écrit une capture brute BGRX en BMP 32 bits (en-tête manuel, sans PIL)"""
+        width, height = frame.size
+        pixels_size = width * height * 4
+
+        # BITMAPFILEHEADER (14 octets) + BITMAPINFOHEADER (40 octets),
+        # hauteur négative : lignes stockées de haut en bas comme dans le tampon MSS
+        header = struct.pack('<2sIHHI', b'BM', 54 + pixels_size, 0, 0, 54)
+        header += struct.pack('<IiiHHIIiiII', 40, width, -height, 1, 32, 0,
+                              pixels_size, 2835, 2835, 0, 0)
+
+        self._write_file_data(path, memoryview(frame.data), header)
+
+    def _write_file_data(self, path: str, data: memoryview, header: bytes = b''):
+        """Écrit des données encodées (précédées d'un en-tête optionnel) en un seul bloc"""
+        # O_BINARY : évite la conversion des fins de ligne sous Windows
+        binary_flag = getattr(os, 'O_BINARY', 0)
+        total_size = len(header) + len(data)
+
+        # Écriture par projection mémoire (optionnelle : peut être plus lente
+        # sur les partages réseau et certains systèmes de fichiers)
+        if self._cached_settings['use_mmap_output'] and total_size > 0:
+            fd = os.open(path, os.O_RDWR | os.O_CREAT | os.O_TRUNC | binary_flag, 0o644)
+            try:
+                os.ftruncate(fd, total_size)
+                with mmap.mmap(fd, total_size) as mapped:
+                    mapped[:len(header)] = header
+                    mapped[len(header):] = data
+                    mapped.flush()
+            finally:
+                os.close(fd)
+            return
+
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | binary_flag, 0o644)
+        try:
+            for chunk in (memoryview(header), data):
+                written = 0
+                while written < len(chunk):
+                    written += os.write(fd, chunk[written:])
+        finally:
+            os.close(fd)
+
+    def _schedule_png_recompress(self, path: str):
+        """Planifie la recompression optimisée d'un PNG en arrière-plan"""
+        pool = self._recompress_pool
+        if pool is None:
+            with self._recompress_pool_lock:
+                if self._recompress_pool is None:
+                    self._recompress_pool = ThreadPoolExecutor(max_workers=1,
+                                                               thread_name_prefix="PngRecompress")
+                pool = self._recompress_pool
+        pool.submit(self._recompress_png, path)
+
+    def _recompress_png(self, path: str):
+        """Réencode un PNG avec optimize=True et remplace le fichier s'il est plus petit"""
+        temp_path = f"{path}.tmp"
+        try:
+            with Image.open(path) as image:
+                image.load()
+                image.save(temp_path, format='PNG', optimize=True)
+
+            if os.path.getsize(temp_path) < os.path.getsize(path):
+                os.replace(temp_path, path)
+            else:
+                os.unlink(temp_path)
+
+        except Exception as e:
+            self.logger.error(f"Erreur recompression PNG: {e}")
+            try:
+                os.unlink(temp_path)
+            except OSError:
+                pass
 
     def _clean_path_for_logging(self, path: str) -> str:
         """Nettoie un chemin de fichier pour les logs sans erreur d'encodage"""
@@ -1497,7 +2309,8 @@ class ScreenshotManager:
 
         return path
 
-    def _generate_filename(self, folder_override: Optional[str], prefix: str) -> str:
+    def _generate_filename(self, folder_override: Optional[str], prefix: str,
+                           extension: Optional[str] = None) -> str:
         """Génère un nom de fichier automatique"""
         # Dossier de destination
         if folder_override:
@@ -1506,99 +2319,129 @@ class ScreenshotManager:
             base_folder = self.settings.get_default_folder()
 
         # Pattern de nom de fichier
-        capture_settings = self.settings.get_capture_settings()
-        pattern = capture_settings.get('filename_pattern', 'Screenshot_%Y%m%d_%H%M%S')
-
-        # Génère le nom avec timestamp
-        timestamp = datetime.now()
-        filename = timestamp.strftime(pattern)
+        pattern = self._cached_settings['filename_pattern']
+
+        # Génère le nom avec timestamp (mis en cache pour les rafales dans la même seconde)
+        now = time.time()
+        second = int(now)
+        cached_second, cached_pattern, cached_name = self._filename_stamp
+        if cached_second == second and cached_pattern == pattern:
+            filename = cached_name
+        else:
+            filename = datetime.fromtimestamp(now).strftime(pattern)
+            # Un motif avec microsecondes (%f) change dans la seconde : jamais en cache
+            if '%f' not in pattern:
+                self._filename_stamp = (second, pattern, filename)
 
         # Ajoute le préfixe si fourni
         if prefix and prefix != "Screenshot":
             filename = f"{prefix}_{filename}"
 
-        # Extension selon le format
-        image_format = capture_settings.get('image_format', 'PNG')
-        extension = image_format.lower()
-        if extension == 'jpeg':
-            extension = 'jpg'
+        # Extension selon le format (celui des encodeurs de cette sauvegarde)
+        if extension is None:
+            extension = self._savers[1]
 
         # Chemin complet
-        full_path = Path(base_folder) / f"{filename}.{extension}"
+        folder = Path(base_folder)
+        full_path = folder / f"{filename}.{extension}"
 
-        # Évite les conflits de noms
+        # En rafale dans la même seconde, reprend après le dernier suffixe
+        # attribué au lieu de retester tous les noms déjà pris
+        name_key = str(full_path)
         counter = 1
-        while full_path.exists():
-            name_without_ext = full_path.stem
-            full_path = full_path.parent / f"{name_without_ext}_{counter}.{extension}"
-            counter += 1
-
-        return str(full_path)
+        with self._name_counter_lock:
+            last_key, last_counter = self._last_name_counter
+            if last_key == name_key:
+                counter = last_counter
+                full_path = folder / f"{filename}_{counter}.{extension}"
+                counter += 1
+
+        # Le motif peut contenir des sous-dossiers (ex: %Y-%m/Shot_%H%M%S)
+        target_dir = full_path.parent
+        self._ensure_directory(target_dir)
+        dir_retried = False
+
+        # Évite les conflits de noms en réservant le fichier de façon atomique
+        # (O_EXCL) : pas de course entre deux captures et un seul appel système
+        # quand le nom est libre
+        while True:
+            try:
+                fd = os.open(str(full_path), os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644)
+            except FileExistsError:
+                full_path = folder / f"{filename}_{counter}.{extension}"
+                counter += 1
+                continue
+            except FileNotFoundError:
+                # Dossier supprimé depuis sa mise en cache : le recrée une seule fois
+                if dir_retried:
+                    raise
+                dir_retried = True
+                self._dir_cache.discard(str(target_dir))
+                self._ensure_directory(target_dir)
+                continue
+
+            os.close(fd)
+            with self._name_counter_lock:
+                self._last_name_counter = (name_key, counter)
+            return str(full_path)
+
+    def _ensure_directory(self, directory: Path):
+        """Crée le dossier s'il n'a pas déjà été vérifié pendant cette session"""
+        key = str(directory)
+        if key not in self._dir_cache:
+            directory.mkdir(parents=True, exist_ok=True)
+            self._dir_cache.add(key)
+
+    def _discard_reserved_file(self, path: str):
+        """Supprime un fichier réservé resté vide (sauvegarde échouée ou déplacée)"""
+        try:
+            if os.path.getsize(path) == 0:
+                os.unlink(path)
+        except OSError:
+            pass
 
     def _sanitize_filename(self, filename: str) -> str:
         """Nettoie un nom de fichier pour éviter les caractères invalides et unicode"""
-        import re
-        import unicodedata
-
-        # Supprime les caractères de contrôle et emojis
-        filename = ''.join(char for char in filename if ord(char) < 127 or not unicodedata.category(char).startswith('C'))
-
-        # Supprime les emojis et symboles unicode
-        emoji_pattern = re.compile("["
-                                   u"\U0001F600-\U0001F64F"  # emoticons
-                                   u"\U0001F300-\U0001F5FF"  # symbols & pictographs
-                                   u"\U0001F680-\U0001F6FF"  # transport & map symbols
-                                   u"\U0001F1E0-\U0001F1FF"  # flags (iOS)
-                                   u"\U00002702-\U000027B0"  # dingbats
-                                   u"\U000024C2-\U0001F251"  # enclosed characters
-                                   "]+", flags=re.UNICODE)
-        filename = emoji_pattern.sub('', filename)
-
-        # Supprime les caractères non-ASCII restants
+        # Supprime tout caractère non-ASCII (emojis, symboles, contrôles unicode)
         filename = filename.encode('ascii', 'ignore').decode('ascii')
 
-        # Replace les caractères interdits
-        invalid_chars = '<>:"/\\|?*'
-        for char in invalid_chars:
-            filename = filename.replace(char, '_')
+        # Remplace les caractères interdits
+        filename = filename.translate(_SANITIZE_TABLE)
 
         # Supprime les espaces multiples et en début/fin
-        filename = re.sub(r'\s+', ' ', filename).strip()
+        filename = _WHITESPACE_RE.sub(' ', filename).strip()
 
         # Évite les noms vides
-        if not filename or filename.isspace():
+        if not filename:
             filename = "Screenshot"
 
         # Limite la longueur
-        return filename[:50] if len(filename) > 50 else filename
-
-    def _cleanup_image_cache(self):
-        """Nettoie le cache d'images"""
-        dead_keys = []
-        for key, weak_ref in self._image_cache.items():
-            if weak_ref() is None:
-                dead_keys.append(key)
-
-        for key in dead_keys:
-            del self._image_cache[key]
+        return filename[:50]
 
     def _cleanup_temp_files(self):
         """Nettoie les fichiers temporaires"""
-        for temp_file in list(self._temp_files):
+        # Échange atomique de l'ensemble : les ajouts concurrents vont dans le nouveau
+        to_delete, self._temp_files = self._temp_files, set()
+
+        for temp_file in to_delete:
             try:
-                if Path(temp_file).exists():
-                    Path(temp_file).unlink()
-                self._temp_files.remove(temp_file)
-            except Exception as e:
+                os.unlink(temp_file)
+            except FileNotFoundError:
+                pass
+            except OSError as e:
                 self.logger.error(f"Erreur nettoyage fichier temp {temp_file}: {e}")
+                # Réessaiera au prochain nettoyage
+                self._temp_files.add(temp_file)
 
     def _update_stats(self, success: bool):
         """Met à jour les statistiques"""
-        self.stats['total_captures'] += 1
-        if success:
-            self.stats['successful_captures'] += 1
-        else:
-            self.stats['failed_captures'] += 1
+        stats = self.stats
+        with self._callbacks_lock:
+            stats.total_captures += 1
+            if success:
+                stats.successful_captures += 1
+            else:
+                stats.failed_captures += 1
 
     def _notify_capture_complete(self, capture_type: str, save_path: str,
                                  app_info: Optional[AppInfo] = None):
@@ -1607,19 +2450,10 @@ class ScreenshotManager:
             self.logger.warning("Application fermée, callbacks ignorés")
             return
 
+        # Tuple immuable : un ajout concurrent remplace l'attribut sans toucher à celui-ci
         for callback in self.capture_callbacks:
-            try:
-                def safe_callback():
-                    try:
-                        if self._app_active:
-                            callback(capture_type, save_path, app_info)
-                    except Exception as e:
-                        self.logger.error(f"Erreur callback capture: {e}")
-
-                threading.Thread(target=safe_callback, daemon=True).start()
-
-            except Exception as e:
-                self.logger.error(f"Erreur callback capture: {e}")
+            self._dispatch_callback(callback, (capture_type, save_path, app_info),
+                                    "Erreur callback capture: %s")
 
     def _notify_error(self, capture_type: str, error_message: str):
         """Notifie une erreur de capture"""
@@ -1628,27 +2462,35 @@ class ScreenshotManager:
             return
 
         for callback in self.error_callbacks:
-            try:
-                def safe_error_callback():
-                    try:
-                        if self._app_active:
-                            callback(capture_type, error_message)
-                    except Exception as e:
-                        self.logger.error(f"Erreur callback erreur: {e}")
+            self._dispatch_callback(callback, (capture_type, error_message),
+                                    "Erreur callback erreur: %s")
 
-                threading.Thread(target=safe_error_callback, daemon=True).start()
+    def _dispatch_callback(self, callback: Callable, args: tuple, error_format: str):
+        """Exécute un callback sur le thread de notification (jamais sur le thread de capture)"""
+        try:
+            self._notify_pool.submit(self._run_callback, callback, args, error_format)
+        except Exception as e:
+            # Pool arrêté (fermeture de l'application)
+            self.logger.error(error_format, e)
 
-            except Exception as e:
-                self.logger.error(f"Erreur callback erreur: {e}")
+    def _run_callback(self, callback: Callable, args: tuple, error_format: str):
+        """Appelle un callback si l'application est toujours active"""
+        try:
+            if self._app_active:
+                callback(*args)
+        except Exception as e:
+            self.logger.error(error_format, e)
 
     # Méthodes de callback
     def add_capture_callback(self, callback: Callable):
         """Ajoute un callback de capture terminée"""
-        self.capture_callbacks.append(callback)
+        with self._callbacks_lock:
+            self.capture_callbacks = self.capture_callbacks + (callback,)
 
     def add_error_callback(self, callback: Callable):
         """Ajoute un callback d'erreur"""
-        self.error_callbacks.append(callback)
+        with self._callbacks_lock:
+            self.error_callbacks = self.error_callbacks + (callback,)
 
     # Méthodes de contrôle du cycle de vie
     def set_app_active(self, active: bool):
@@ -1660,17 +2502,22 @@ class ScreenshotManager:
     # Méthodes utilitaires
     def get_stats(self) -> Dict[str, Any]:
         """Retourne les statistiques"""
-        return self.stats.copy()
+        # Relevé à la demande : la capture ne mesure plus la mémoire systématiquement
+        self.stats.memory_usage_mb = self.memory_manager.get_current_memory_usage()
+        return self.stats.as_dict()
 
     def clear_cache(self):
         """Vide tous les caches"""
-        self._cleanup_image_cache()
+        self._screen_size = None
+        self._dir_cache.clear()
+        with self._image_pool_lock:
+            self._image_pool.clear()
         self._cleanup_temp_files()
         self.memory_manager.force_cleanup()
 
     def get_supported_formats(self) -> list:
         """Retourne les formats d'image supportés"""
-        return ['PNG', 'JPEG', 'BMP', 'GIF']
+        return list(_SUPPORTED_FORMATS)
 
     def test_capture_capability(self) -> Dict[str, bool]:
         """Teste les capacités de capture"""
@@ -1685,18 +2532,20 @@ class ScreenshotManager:
         }
 
         try:
-            # Test capture simple
-            test_img = pyautogui.screenshot()
-            test_img.thumbnail((1, 1))  # Réduit pour économiser la mémoire
-            del test_img
+            # Test capture d'un seul pixel (même backend que les captures réelles)
+            self._probe_capture_backend()
+
+        except Exception as e:
+            self.logger.error(f"Erreur test capacités: {e}")
+            capabilities['fullscreen'] = False
 
-            # Test détection d'app
+        try:
+            # Test détection d'app (indépendant du backend de capture)
             current_app = self.app_detector.get_current_app()
             capabilities['app_detection'] = current_app is not None
 
         except Exception as e:
-            self.logger.error(f"Erreur test capacités: {e}")
-            capabilities['fullscreen'] = False
+            self.logger.error(f"Erreur test détection d'application: {e}")
 
         return capabilities
 
@@ -1705,5 +2554,13 @@ class ScreenshotManager:
         try:
             self.set_app_active(False)  # Désactive les callbacks
             self.clear_cache()
+            self._close_mss()
+            with self._gdi_lock:
+                self._release_gdi_region_cache()
+            self._save_pool.shutdown(wait=False)
+            # Notifications en attente sans objet une fois l'application fermée
+            self._notify_pool.shutdown(wait=False, cancel_futures=True)
+            if self._recompress_pool is not None:
+                self._recompress_pool.shutdown(wait=False)
         except Exception:
             pass
\ No newline at end of file
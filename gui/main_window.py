@@ -713,7 +713,7 @@ class SnapMasterGUI:
         ttk.Label(settings_grid, text="🎨 Format:", style='TLabel').grid(row=0, column=0, sticky='w', padx=5, pady=5)
         self.format_var = tk.StringVar(value=self.settings.get_capture_settings().get('image_format', 'PNG'))
         format_combo = ttk.Combobox(settings_grid, textvariable=self.format_var,
-                                    values=['PNG', 'JPEG', 'BMP'], state='readonly', width=10,
+                                    values=['PNG', 'JPEG', 'BMP', 'WEBP'], state='readonly', width=10,
                                     style='TCombobox')
         format_combo.grid(row=0, column=1, sticky='w', padx=5, pady=5)
         format_combo.bind('<<ComboboxSelected>>', self._on_format_change)
@@ -130,9 +130,7 @@ def add_methods_to_gui(gui_class):
     def _test_screen_access(self):
         """Teste l'accès à la capture d'écran"""
         try:
-            import pyautogui
-            test_screenshot = pyautogui.screenshot()
-            return test_screenshot.size[0] > 0 and test_screenshot.size[1] > 0
+            return self.screenshot_manager.test_capture_capability().get('fullscreen', False)
         except:
             return False
 
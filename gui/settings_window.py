@@ -134,7 +134,7 @@ class SettingsWindow:
         ttk.Label(fmt_frame, text="Format par défaut:").pack(side=tk.LEFT)
         self.vars['image_format'] = tk.StringVar()
         fmt_combo = ttk.Combobox(fmt_frame, textvariable=self.vars['image_format'],
-                                 values=['PNG', 'JPEG', 'BMP', 'GIF'], state='readonly', width=10)
+                                 values=['PNG', 'JPEG', 'BMP', 'GIF', 'WEBP'], state='readonly', width=10)
         fmt_combo.pack(side=tk.LEFT, padx=5)
 
         # Qualité